@@ -1,9 +1,12 @@
 """Coordinator for fetching data from Google Tasks API."""
 
 import asyncio
-import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
-from typing import Any, Final
+from operator import itemgetter
+import re
+from typing import Any, Final, cast
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
@@ -12,9 +15,188 @@ from .api import AsyncConfigEntryAuth
 
 _LOGGER = logging.getLogger(__name__)
 
-UPDATE_INTERVAL: Final = datetime.timedelta(minutes=30)
+UPDATE_INTERVAL: Final = timedelta(minutes=30)
 TIMEOUT = 10
 
+# Sort key for tasks without any due date, ordering them last.
+_NO_DUE_DATE = datetime.max.isoformat()
+
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+_MONTH_NAME = f"(?P<month_name>{'|'.join(_MONTHS)})"
+
+# Each pattern captures its date fields by name so the date can be built
+# directly from the match, in order of preference for ambiguous dates.
+DATE_PATTERNS = [
+    r"(?P<year>\d{4})/(?P<month>\d{2})/(?P<day>\d{2})",
+    r"(?P<day>\d{2})/(?P<month>\d{2})/(?P<year>\d{4})",
+    r"(?P<month>\d{2})/(?P<day>\d{2})/(?P<year>\d{4})",
+    r"(?P<day>\d{1,2})\s" + _MONTH_NAME + r"\s(?P<year>\d{4})",
+    _MONTH_NAME + r"\s(?P<day>\d{1,2}),?\s(?P<year>\d{4})",
+    r"(?P<year>\d{4})\s" + _MONTH_NAME + r"\s(?P<day>\d{1,2})",
+    r"(?P<year>\d{4})\s(?P<day>\d{1,2})\s" + _MONTH_NAME,
+]
+
+TIME_PATTERN = r"(?P<hour>\d{1,2}):(?P<minute>\d{2})(?:\s?(?P<meridiem>[AP]M))?"
+
+# All date patterns fused into one alternation so a single scan finds the
+# first date in the text; the named group that fired identifies the pattern.
+# Group names may not repeat across alternatives, so the field groups are
+# only captured when re-matching the individual pattern.
+_DATE_RE = re.compile(
+    "|".join(
+        f"(?P<f{i}>{re.sub(r'[(][?]P<[a-z_]+>', '(?:', pattern)})"
+        for i, pattern in enumerate(DATE_PATTERNS)
+    )
+)
+_DATE_PATTERN_RES = tuple(re.compile(pattern) for pattern in DATE_PATTERNS)
+_TIME_RE = re.compile(TIME_PATTERN)
+# Every date and time pattern needs a digit, which rules out most task texts
+# far more cheaply than running the patterns.
+_HAS_DIGIT_RE = re.compile(r"\d")
+
+PRIORITY_KEYWORDS = [
+    "ASAP",
+    "Urgent",
+    "Immediately",
+    "Critical",
+    "Important",
+    "Top Priority",
+    "Must Do",
+    "High Importance",
+]
+# The keywords are all ASCII, so ASCII-only case folding in the regex engine
+# replaces lowercasing every text before searching it.
+_PRIORITY_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in PRIORITY_KEYWORDS),
+    re.IGNORECASE | re.ASCII,
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_priority_task(title: str, description: str | None) -> bool:
+    """Return whether the task title or description has a priority keyword."""
+    return any(
+        _PRIORITY_RE.search(text) is not None
+        for text in (title, description)
+        if text
+    )
+
+
+def _date_from_match(match: re.Match[str]) -> datetime:
+    """Build a date from the fields captured by a date pattern."""
+    fields = match.groupdict()
+    if (month_name := fields.get("month_name")) is not None:
+        month = _MONTHS[month_name]
+    else:
+        month = int(fields["month"])
+    return datetime(int(fields["year"]), month, int(fields["day"]))
+
+
+def _parse_date(text: str) -> datetime | None:
+    """Return the first valid date found in the text."""
+    pos = 0
+    while match := _DATE_RE.search(text, pos):
+        start = match.start()
+        index = int(cast(str, match.lastgroup)[1:])
+        # Patterns may overlap (e.g. day-first and month-first), so fall back
+        # to the later ones matching at the same position before moving on.
+        for pattern in _DATE_PATTERN_RES[index:]:
+            if candidate := pattern.match(text, start):
+                try:
+                    return _date_from_match(candidate)
+                except ValueError:
+                    continue
+        pos = start + 1
+    return None
+
+
+def _hour_from_match(match: re.Match[str]) -> int:
+    """Return the 24-hour clock hour captured by the time pattern."""
+    hour = int(match["hour"])
+    if (meridiem := match["meridiem"]) is None:
+        return hour
+    if not 1 <= hour <= 12:
+        raise ValueError(f"Invalid 12-hour clock hour: {hour}")
+    return hour % 12 + (12 if meridiem == "PM" else 0)
+
+
+@lru_cache(maxsize=4096)
+def _extract_date_time(*texts: str) -> tuple[datetime | None, str | None]:
+    """Extract a due date and time mentioned in the texts."""
+    texts = tuple(text for text in texts if _HAS_DIGIT_RE.search(text))
+    if not texts:
+        return None, None
+
+    # The texts (e.g. title and notes) are scanned one by one rather than
+    # joined, taking the first date and the first time found.
+    extracted_date: datetime | None = None
+    for text in texts:
+        if extracted_date := _parse_date(text):
+            break
+
+    time_match: re.Match[str] | None = None
+    for text in texts:
+        if time_match := _TIME_RE.search(text):
+            break
+    extracted_time = time_match.group() if time_match else None
+
+    if extracted_date and time_match:
+        try:
+            extracted_date = extracted_date.replace(
+                hour=_hour_from_match(time_match), minute=int(time_match["minute"])
+            )
+        except ValueError:
+            pass
+
+    return extracted_date, extracted_time
+
+
+def _order_tasks(tasks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Order tasks by completion, priority and due date."""
+
+    def get_due_key(task: dict[str, Any]) -> str:
+        # Due dates are compared as ISO 8601 strings, which sort the same as
+        # the dates they represent, so the API value needs no parsing.
+        if due_str := task.get("due"):
+            return due_str
+        title = task.get("title", "")
+        notes = task.get("notes", "")
+        extracted_datetime, _ = _extract_date_time(title, notes)
+        if extracted_datetime:
+            return extracted_datetime.isoformat()
+        return _NO_DUE_DATE
+
+    # Decorate each incomplete task with its sort key in a single pass so the
+    # due date and priority are only computed once per task. Completed tasks
+    # are ordered by when they were completed, which needs no parsing.
+    incomplete: list[tuple[tuple[bool, str], dict[str, Any]]] = []
+    completed: list[dict[str, Any]] = []
+    for task in tasks:
+        if task.get("status") == "completed":
+            completed.append(task)
+            continue
+        is_priority = _is_priority_task(task["title"], task.get("notes"))
+        incomplete.append(((not is_priority, get_due_key(task)), task))
+
+    incomplete.sort(key=itemgetter(0))
+    # The completed timestamps are RFC 3339 strings, which sort chronologically.
+    completed.sort(key=lambda task: task.get("completed", ""))
+
+    return completed + [task for _, task in incomplete]
+
 
 class TaskUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
     """Coordinator for fetching Google Tasks for a Task List form the API."""
@@ -33,6 +215,7 @@ class TaskUpdateCoordinator(DataUpdateCoordinator[list[dict[str, Any]]]):
         self._task_list_id = task_list_id
 
     async def _async_update_data(self) -> list[dict[str, Any]]:
-        """Fetch tasks from API endpoint."""
+        """Fetch tasks from API endpoint, sorted for display."""
         async with asyncio.timeout(TIMEOUT):
-            return await self.api.list_tasks(self._task_list_id)
+            tasks = await self.api.list_tasks(self._task_list_id)
+        return _order_tasks(tasks)
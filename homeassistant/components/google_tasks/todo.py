@@ -1,6 +1,5 @@
 from datetime import datetime, timedelta
 import logging
-import re
 from typing import Any, cast
 
 from homeassistant.components.todo import (
@@ -10,14 +9,14 @@ from homeassistant.components.todo import (
     TodoListEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from .api import AsyncConfigEntryAuth
 from .const import DOMAIN
-from .coordinator import TaskUpdateCoordinator
+from .coordinator import TaskUpdateCoordinator, _extract_date_time
 from .exceptions import GoogleTasksApiError
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,59 +29,16 @@ TODO_STATUS_MAP = {
 }
 TODO_STATUS_MAP_INV = {v: k for k, v in TODO_STATUS_MAP.items()}
 
-DATE_PATTERNS = [
-    (r"\d{4}/\d{2}/\d{2}", "%Y/%m/%d"),
-    (r"\d{2}/\d{2}/\d{4}", "%d/%m/%Y"),
-    (r"\d{2}/\d{2}/\d{4}", "%m/%d/%Y"),
-    (
-        r"\d{1,2}\s(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s\d{4}",
-        "%d %b %Y",
-    ),
-    (
-        r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s\d{1,2},?\s\d{4}",
-        "%b %d %Y",
-    ),
-    (
-        r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s\d{1,2}\s\d{4}",
-        "%b %d %Y",
-    ),
-    (
-        r"\d{4}\s(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s\d{1,2}",
-        "%Y %b %d",
-    ),
-    (
-        r"\d{4}\s\d{1,2}\s(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)",
-        "%Y %d %b",
-    ),
-]
-
-TIME_PATTERN = r"(\d{1,2}:\d{2}(?:\s?[AP]M)?)"
-
-PRIORITY_KEYWORDS = [
-    "ASAP",
-    "Urgent",
-    "Immediately",
-    "Critical",
-    "Important",
-    "Top Priority",
-    "Must Do",
-    "High Importance",
-]
-
 
 def _format_due_datetime(due: datetime) -> str:
     return due.isoformat() + "Z"
 
 
-def _is_priority_task(title: str, description: str | None) -> bool:
-    text = f"{title} {description or ''}".lower()
-    return any(keyword.lower() in text for keyword in PRIORITY_KEYWORDS)
-
-
 def _convert_todo_item(item: TodoItem) -> dict[str, Any]:
-    result: dict[str, Any] = {}
-    result["title"] = item.summary
-    result["status"] = TODO_STATUS_MAP_INV.get(item.status, "needsAction")
+    result: dict[str, Any] = {
+        "title": item.summary,
+        "status": TODO_STATUS_MAP_INV.get(item.status, "needsAction"),
+    }
     if item.due:
         result["due"] = _format_due_datetime(dt_util.as_utc(item.due))
     if item.description:
@@ -90,36 +46,6 @@ def _convert_todo_item(item: TodoItem) -> dict[str, Any]:
     return result
 
 
-def _extract_date_time(text: str) -> tuple[datetime | None, str | None]:
-    date_match = None
-    extracted_date = None
-    for pattern, date_format in DATE_PATTERNS:
-        if match := re.search(pattern, text):
-            date_match = match.group()
-            try:
-                extracted_date = datetime.strptime(date_match, date_format)
-                break
-            except ValueError:
-                continue
-
-    time_match = re.search(TIME_PATTERN, text)
-    extracted_time = time_match.group() if time_match else None
-
-    if extracted_date and extracted_time:
-        try:
-            if "AM" in extracted_time or "PM" in extracted_time:
-                time_obj = datetime.strptime(extracted_time.strip(), "%I:%M %p")
-            else:
-                time_obj = datetime.strptime(extracted_time.strip(), "%H:%M")
-            extracted_date = extracted_date.replace(
-                hour=time_obj.hour, minute=time_obj.minute
-            )
-        except ValueError:
-            pass
-
-    return extracted_date, extracted_time
-
-
 def _convert_api_item(item: dict[str, Any]) -> TodoItem:
     due: datetime | None = None
     if (due_str := item.get("due")) is not None:
@@ -127,7 +53,7 @@ def _convert_api_item(item: dict[str, Any]) -> TodoItem:
     else:
         title = item.get("title", "")
         notes = item.get("notes", "")
-        extracted_datetime, _ = _extract_date_time(f"{title} {notes}")
+        extracted_datetime, _ = _extract_date_time(title, notes)
         if extracted_datetime:
             due = extracted_datetime
 
@@ -187,23 +113,67 @@ class GoogleTaskTodoListEntity(
         self._attr_name = name.capitalize()
         self._attr_unique_id = f"{config_entry_id}-{task_list_id}"
         self._task_list_id = task_list_id
+        self._cached_data: list[dict[str, Any]] | None = None
+        self._cached_items: list[TodoItem] | None = None
+        self._indexed_data: list[dict[str, Any]] | None = None
+        self._tasks_by_id: dict[str, dict[str, Any]] = {}
+        self._item_cache: dict[tuple[str, str], TodoItem] = {}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._cached_data = None
+        self._cached_items = None
+        self._indexed_data = None
+        self._tasks_by_id = {}
+        super()._handle_coordinator_update()
+
+    def _task_index(self) -> dict[str, dict[str, Any]]:
+        data = self.coordinator.data
+        if data is not self._indexed_data:
+            self._tasks_by_id = {task["id"]: task for task in data}
+            self._indexed_data = data
+        return self._tasks_by_id
 
     @property
     def todo_items(self) -> list[TodoItem] | None:
-        if self.coordinator.data is None:
+        if (data := self.coordinator.data) is None:
             return None
-        return [_convert_api_item(item) for item in _order_tasks(self.coordinator.data)]
+        # The items are read several times per update, so only rebuild them
+        # when the coordinator hands us a new task list.
+        if data is not self._cached_data:
+            self._cached_items = self._convert_tasks(data)
+            self._cached_data = data
+        return self._cached_items
+
+    def _convert_tasks(self, tasks: list[dict[str, Any]]) -> list[TodoItem]:
+        # The API bumps a task's "updated" timestamp on every change, so items
+        # converted on a previous refresh are reused while it stays the same.
+        # Only the tasks still in the list are kept in the cache.
+        previous_cache = self._item_cache
+        item_cache: dict[tuple[str, str], TodoItem] = {}
+        items: list[TodoItem] = []
+        for task in tasks:
+            if (updated := task.get("updated")) is None:
+                items.append(_convert_api_item(task))
+                continue
+            key = (task["id"], updated)
+            if (item := previous_cache.get(key)) is None:
+                item = _convert_api_item(task)
+            item_cache[key] = item
+            items.append(item)
+        self._item_cache = item_cache
+        return items
 
     async def async_create_todo_item(self, item: TodoItem) -> None:
         await self.coordinator.api.insert(
             self._task_list_id,
             task=_convert_todo_item(item),
         )
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_request_refresh()
 
     async def async_update_todo_item(self, item: TodoItem) -> None:
         uid: str = cast(str, item.uid)
-        existing_item = next((i for i in self.coordinator.data if i["id"] == uid), None)
+        existing_item = self._task_index().get(uid)
         if existing_item:
             updated_item = _convert_todo_item(item)
             try:
@@ -212,43 +182,18 @@ class GoogleTaskTodoListEntity(
                     uid,
                     task=updated_item,
                 )
-                await self.coordinator.async_refresh()
+                await self.coordinator.async_request_refresh()
             except GoogleTasksApiError as err:
                 _LOGGER.error("Error updating todo item: %s", err)
                 raise
 
     async def async_delete_todo_items(self, uids: list[str]) -> None:
         await self.coordinator.api.delete(self._task_list_id, uids)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_request_refresh()
 
     async def async_move_todo_item(
         self, uid: str, previous_uid: str | None = None
     ) -> None:
         await self.coordinator.api.move(self._task_list_id, uid, previous=previous_uid)
-        await self.coordinator.async_refresh()
-
-
-def _order_tasks(tasks: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    def get_due_date(task):
-        due_str = task.get("due")
-        if due_str:
-            return dt_util.parse_datetime(due_str)
-        title = task.get("title", "")
-        notes = task.get("notes", "")
-        extracted_datetime, _ = _extract_date_time(f"{title} {notes}")
-        return extracted_datetime or datetime.max
-
-    def sort_key(task):
-        is_completed = task.get("status") == "completed"
-        is_priority = _is_priority_task(task["title"], task.get("notes"))
-        due_date = get_due_date(task)
-        return (is_completed, not is_priority, due_date)
-
-    incomplete_tasks = [task for task in tasks if task.get("status") != "completed"]
-    completed_tasks = [task for task in tasks if task.get("status") == "completed"]
-
-    sorted_incomplete = sorted(incomplete_tasks, key=sort_key)
-    sorted_completed = sorted(completed_tasks, key=sort_key)
-
-    return sorted_completed + sorted_incomplete
+        await self.coordinator.async_request_refresh()
 
@@ -5,14 +5,16 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from homeassistant.components.google_tasks.coordinator import (
+    _extract_date_time,
+    _is_priority_task,
+    _order_tasks,
+)
 from homeassistant.components.google_tasks.todo import (
     GoogleTaskTodoListEntity,
     _convert_api_item,
     _convert_todo_item,
-    _extract_date_time,
     _format_due_datetime,
-    _is_priority_task,
-    _order_tasks,
 )
 from homeassistant.components.todo import TodoItem, TodoItemStatus
 from homeassistant.util import dt as dt_util
@@ -42,6 +44,41 @@ def test_extract_date_time():
     assert time == "18:00"
 
 
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Pay rent 2024/11/27", datetime(2024, 11, 27)),
+        ("Pay rent 27/11/2024", datetime(2024, 11, 27)),
+        ("Pay rent 11/27/2024", datetime(2024, 11, 27)),
+        ("Pay rent Nov 27 2024", datetime(2024, 11, 27)),
+        ("Pay rent Nov 27, 2024", datetime(2024, 11, 27)),
+        ("Pay rent 2024 Nov 27", datetime(2024, 11, 27)),
+        ("Pay rent 2024 27 Nov", datetime(2024, 11, 27)),
+        ("Ignore 2024/13/45 but pay 27 Nov 2024", datetime(2024, 11, 27)),
+    ],
+)
+def test_extract_date_time_formats(text: str, expected: datetime) -> None:
+    """Test extraction of each supported date format."""
+    date, time = _extract_date_time(text)
+    assert date == expected
+    assert time is None
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Call 2024/11/27 5:30 PM", datetime(2024, 11, 27, 17, 30)),
+        ("Call 2024/11/27 5:30PM", datetime(2024, 11, 27, 17, 30)),
+        ("Call 2024/11/27 12:15 AM", datetime(2024, 11, 27, 0, 15)),
+        ("Call 2024/11/27 13:15 PM", datetime(2024, 11, 27)),
+    ],
+)
+def test_extract_date_time_12_hour_clock(text: str, expected: datetime) -> None:
+    """Test extraction of 12-hour clock times."""
+    date, _ = _extract_date_time(text)
+    assert date == expected
+
+
 def test_is_priority_task():
     """Test priority task detection."""
     assert _is_priority_task("Urgent meeting", "Important discussion")
@@ -68,6 +105,40 @@ def test_order_tasks():
     assert ordered[2]["id"] == "3"
 
 
+def test_order_tasks_by_due_date():
+    """Test tasks are ordered by API and extracted due dates together."""
+    tasks = [
+        {"id": "1", "title": "No due date"},
+        {"id": "2", "title": "Pay rent 2024/11/29"},
+        {"id": "3", "title": "Dentist", "due": "2024-11-28T00:00:00.000Z"},
+        {"id": "4", "title": "Call 2024/11/28 9:30"},
+    ]
+    ordered = _order_tasks(tasks)
+    assert [task["id"] for task in ordered] == ["3", "4", "2", "1"]
+
+
+def test_order_tasks_partitions_by_status():
+    """Test completed tasks are ordered by completion time ahead of the rest."""
+    tasks = [
+        {"id": "1", "title": "Regular task", "status": "needsAction"},
+        {
+            "id": "2",
+            "title": "Urgent done task",
+            "status": "completed",
+            "completed": "2024-11-27T10:00:00.000Z",
+        },
+        {"id": "3", "title": "Urgent task", "status": "needsAction"},
+        {
+            "id": "4",
+            "title": "Done task",
+            "status": "completed",
+            "completed": "2024-11-26T10:00:00.000Z",
+        },
+    ]
+    ordered = _order_tasks(tasks)
+    assert [task["id"] for task in ordered] == ["4", "2", "3", "1"]
+
+
 def test_convert_todo_item_no_due_date():
     """Test conversion of TodoItem without due date."""
     item = TodoItem(summary="Task without due date", status=TodoItemStatus.NEEDS_ACTION)
@@ -94,6 +165,25 @@ def test_is_priority_task_case_insensitive():
     """Test priority task detection case insensitivity."""
     assert _is_priority_task("urgent meeting", "important discussion")
     assert _is_priority_task("ASAP task", None)
+    assert _is_priority_task("TOP PRIORITY", None)
+
+
+def test_is_priority_task_description_only():
+    """Test priority keywords are found in the description alone."""
+    assert _is_priority_task("Regular task", "This is urgent")
+    assert not _is_priority_task("", None)
+
+
+def test_convert_api_item_date_in_notes():
+    """Test the due date is extracted from the notes when not in the title."""
+    api_item = {
+        "id": "123",
+        "title": "Dentist at 9:30",
+        "status": "needsAction",
+        "notes": "Booked for 2024/11/28",
+    }
+    result = _convert_api_item(api_item)
+    assert result.due == datetime(2024, 11, 28, 9, 30)
 
 
 def test_convert_todo_item_completed_status():
@@ -103,12 +193,48 @@ def test_convert_todo_item_completed_status():
     assert result["status"] == "completed"
 
 
+def test_todo_items_cached_until_new_data():
+    """Test todo items are only rebuilt when the coordinator data changes."""
+    coordinator = Mock()
+    coordinator.data = [{"id": "1", "title": "Regular task"}]
+
+    entity = GoogleTaskTodoListEntity(coordinator, "Test List", "config_id", "list_id")
+
+    items = entity.todo_items
+    assert entity.todo_items is items
+    assert [item.uid for item in items] == ["1"]
+
+    coordinator.data = [{"id": "2", "title": "Another task"}]
+    assert [item.uid for item in entity.todo_items] == ["2"]
+
+
+def test_todo_items_reused_while_unchanged():
+    """Test converted items are reused until the task is updated."""
+    coordinator = Mock()
+    coordinator.data = [
+        {"id": "1", "title": "Regular task", "updated": "2024-11-27T10:00:00.000Z"},
+        {"id": "2", "title": "Another task", "updated": "2024-11-27T10:00:00.000Z"},
+    ]
+
+    entity = GoogleTaskTodoListEntity(coordinator, "Test List", "config_id", "list_id")
+    first, second = entity.todo_items
+
+    coordinator.data = [
+        {"id": "1", "title": "Regular task", "updated": "2024-11-27T10:00:00.000Z"},
+        {"id": "2", "title": "Renamed task", "updated": "2024-11-27T11:00:00.000Z"},
+    ]
+    items = entity.todo_items
+    assert items[0] is first
+    assert items[1] is not second
+    assert items[1].summary == "Renamed task"
+
+
 @pytest.mark.asyncio
 async def test_async_create_todo_item():
     """Test async creation of a todo item."""
     coordinator = Mock()
     coordinator.api.insert = AsyncMock()
-    coordinator.async_refresh = AsyncMock()
+    coordinator.async_request_refresh = AsyncMock()
 
     entity = GoogleTaskTodoListEntity(coordinator, "Test List", "config_id", "list_id")
 
@@ -117,7 +243,7 @@ async def test_async_create_todo_item():
     await entity.async_create_todo_item(item)
 
     coordinator.api.insert.assert_called_once()
-    coordinator.async_refresh.assert_called_once()
+    coordinator.async_request_refresh.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -125,7 +251,7 @@ async def test_async_update_todo_item():
     """Test async updating of a todo item."""
     coordinator = Mock()
     coordinator.api.patch = AsyncMock()
-    coordinator.async_refresh = AsyncMock()
+    coordinator.async_request_refresh = AsyncMock()
     coordinator.data = [{"id": "123", "title": "Old task"}]
 
     entity = GoogleTaskTodoListEntity(coordinator, "Test List", "config_id", "list_id")
@@ -137,7 +263,27 @@ async def test_async_update_todo_item():
     await entity.async_update_todo_item(item)
 
     coordinator.api.patch.assert_called_once()
-    coordinator.async_refresh.assert_called_once()
+    coordinator.async_request_refresh.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_update_unknown_todo_item():
+    """Test updating an item that is not in the task list is ignored."""
+    coordinator = Mock()
+    coordinator.api.patch = AsyncMock()
+    coordinator.async_request_refresh = AsyncMock()
+    coordinator.data = [{"id": "123", "title": "Old task"}]
+
+    entity = GoogleTaskTodoListEntity(coordinator, "Test List", "config_id", "list_id")
+
+    item = TodoItem(
+        uid="456", summary="Updated task", status=TodoItemStatus.NEEDS_ACTION
+    )
+
+    await entity.async_update_todo_item(item)
+
+    coordinator.api.patch.assert_not_called()
+    coordinator.async_request_refresh.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -145,14 +291,14 @@ async def test_async_delete_todo_items():
     """Test async deletion of todo items."""
     coordinator = Mock()
     coordinator.api.delete = AsyncMock()
-    coordinator.async_refresh = AsyncMock()
+    coordinator.async_request_refresh = AsyncMock()
 
     entity = GoogleTaskTodoListEntity(coordinator, "Test List", "config_id", "list_id")
 
     await entity.async_delete_todo_items(["123", "456"])
 
     coordinator.api.delete.assert_called_once_with("list_id", ["123", "456"])
-    coordinator.async_refresh.assert_called_once()
+    coordinator.async_request_refresh.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -160,14 +306,14 @@ async def test_async_move_todo_item():
     """Test async moving of a todo item."""
     coordinator = Mock()
     coordinator.api.move = AsyncMock()
-    coordinator.async_refresh = AsyncMock()
+    coordinator.async_request_refresh = AsyncMock()
 
     entity = GoogleTaskTodoListEntity(coordinator, "Test List", "config_id", "list_id")
 
     await entity.async_move_todo_item("123", previous_uid="456")
 
     coordinator.api.move.assert_called_once_with("list_id", "123", previous="456")
-    coordinator.async_refresh.assert_called_once()
+    coordinator.async_request_refresh.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -176,7 +322,7 @@ async def test_integration_create_and_delete_todo_items():
     coordinator = Mock()
     coordinator.api.insert = AsyncMock(side_effect=[{"id": "task1"}, {"id": "task2"}])
     coordinator.api.delete = AsyncMock()
-    coordinator.async_refresh = AsyncMock()
+    coordinator.async_request_refresh = AsyncMock()
     coordinator.data = []
 
     entity = GoogleTaskTodoListEntity(coordinator, "Test List", "config_id", "list_id")
@@ -192,5 +338,5 @@ async def test_integration_create_and_delete_todo_items():
 
     assert coordinator.api.insert.call_count == 2
     coordinator.api.delete.assert_called_once_with("list_id", ["task1", "task2"])
-    assert coordinator.async_refresh.call_count == 3
+    assert coordinator.async_request_refresh.call_count == 3
 